@@ -1,31 +1,27 @@
 from dataclasses import dataclass
 from functools import lru_cache
+import sys
 
-from typing import Final, Tuple
-
-import re
+from typing import Any, Dict, Final, Tuple
 
 
 class ArnException(ValueError):
     """Thrown when an arn cannot be parsed."""
 
 
-AWS_ARN_REGEX: Final = re.compile(
-    r"""
-    ^arn:
-    (?P<partition>.*?):
-    (?P<service>.*?):
-    (?P<region>.*?):
-    (?P<account>.*?):
-    (?P<resource>.*?)
-    $
-    """,
-    re.VERBOSE,
-)
+# slots make instances smaller and faster, but dataclasses only support them from python 3.10.
+_DATACLASS_SLOTS: Final[Dict[str, Any]] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _ResourceParts:
+    """Holds the split resource of an `Arn` outside of its dataclass fields, and thus of eq, repr and asdict."""
+
+    __slots__ = ("_resource_parts",)
+    _resource_parts: Tuple[str, str]
 
 
-@dataclass
-class Arn:
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class Arn(_ResourceParts):
     """
     Used to access individual components in an arn.
     https://docs.aws.amazon.com/general/latest/gr/aws-arns-and-namespaces.html
@@ -37,6 +33,20 @@ class Arn:
     account: str = ""
     resource: str = ""
 
+    def __post_init__(self) -> None:
+        # the resource type and id are split once per instance
+        object.__setattr__(self, "_resource_parts", _split_resource_type_and_id(self.resource))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Copies and pickles go through __init__, so that the resource is split again."""
+        return self.__class__, (
+            self.partition,
+            self.service,
+            self.region,
+            self.account,
+            self.resource,
+        )
+
     @property
     def resource_type(self) -> str:
         """
@@ -50,7 +60,7 @@ class Arn:
          - arn:aws:ec2:::vpc/vpc-12345                             -> vpc
          - arn:aws:sns:::my_sns_topic                              -> ""
         """
-        return _split_resource_type_and_id(self.resource)[0]
+        return self._resource_parts[0]
 
     @property
     def resource_id(self) -> str:
@@ -65,28 +75,41 @@ class Arn:
          - "arn:aws:ec2:::vpc/vpc-12345                             -> vpc-12345
          - 'arn:aws:sns:::my_sns_topic                              -> ""
         """
-        return _split_resource_type_and_id(self.resource)[1]
+        return self._resource_parts[1]
 
     def __str__(self) -> str:
         """Return the arn as a string."""
-        return ":".join(
-            ("arn", self.partition, self.service, self.region, self.account, self.resource)
-        )
+        return f"arn:{self.partition}:{self.service}:{self.region}:{self.account}:{self.resource}"
 
 
-@lru_cache(maxsize=64)
+@lru_cache(maxsize=512)
 def _split_resource_type_and_id(resource: str) -> Tuple[str, str]:
     """Splits a resource into its type and id parts. Will return 2 empty strings if this resource cannot be split."""
-    first_split_char = next((c for c in resource if c in ":/"), None)
-    if not first_split_char:
+    colon_index = resource.find(":")
+    slash_index = resource.find("/")
+    if colon_index == -1 and slash_index == -1:
         return "", ""
 
-    resource_type, resource_id = resource.split(first_split_char, maxsplit=1)
-    return resource_type, resource_id
+    if colon_index == -1:
+        split_index = slash_index
+    elif slash_index == -1:
+        split_index = colon_index
+    else:
+        split_index = min(colon_index, slash_index)
+
+    resource_type, _, resource_id = resource.partition(resource[split_index])
+    # interned so that the cached parts are shared between equal resources
+    return sys.intern(resource_type), sys.intern(resource_id)
 
 
+@lru_cache(maxsize=1024)
 def arnparse(arn: str) -> Arn:
-    """Parse an arn string into an Arn instance."""
-    if match := AWS_ARN_REGEX.match(arn):
-        return Arn(**match.groupdict())
-    raise ArnException(f"{arn} cannot be parsed.")
+    """Parse an arn string into an Arn instance. Instances are immutable and cached by arn."""
+    # like the `$` of the regex this parser used to be, a single trailing newline is ignored.
+    stripped = arn[:-1] if arn.endswith("\n") else arn
+    parts = stripped.split(":", 5)
+    if len(parts) != 6 or parts[0] != "arn" or "\n" in stripped:
+        raise ArnException(f"{arn} cannot be parsed.")
+
+    _, partition, service, region, account, resource = parts
+    return Arn(partition, service, region, account, resource)
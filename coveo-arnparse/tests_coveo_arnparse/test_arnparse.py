@@ -1,8 +1,12 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError, asdict, astuple, replace
+
 import pytest
 from coveo_testing.markers import UnitTest
 from coveo_testing.parametrize import parametrize
 
-from coveo_arnparse import arnparse, ArnException
+from coveo_arnparse import Arn, arnparse, ArnException
 
 
 @UnitTest
@@ -41,6 +45,10 @@ def test_arn_parse(arn: str) -> None:
         # not arns
         "deliverystream/ndev-document-status",
         "ndev-document-status",
+        # newlines are only ignored at the very end
+        "arn:aws:firehose:us-east-1:064790157154:deliverystream/ndev-document-status\n\n",
+        "arn:aws:firehose:us-east-1:064790157154:deliverystream/ndev-\ndocument-status",
+        "arn:aws:firehose:us-east-1\n:064790157154:deliverystream/ndev-document-status",
     ],
 )
 def test_arn_parse_exception(arn: str) -> None:
@@ -69,3 +77,40 @@ def test_arn_resource_split(arn: str, expected_type: str, expected_id: str) -> N
     parsed = arnparse(arn)
     assert parsed.resource_type == expected_type
     assert parsed.resource_id == expected_id
+
+
+@UnitTest
+def test_arn_parse_cached() -> None:
+    """Parsing the same arn twice returns the same immutable instance."""
+    arn = "arn:aws:ssm:::parameter/path/to/param"
+    parsed = arnparse(arn)
+    assert arnparse(arn) is parsed
+
+    with pytest.raises(FrozenInstanceError):
+        parsed.resource = "parameter/other"  # type: ignore[misc]
+
+
+@UnitTest
+def test_arn_fields() -> None:
+    """Only the arn components are dataclass fields."""
+    parsed = arnparse("arn:aws:ssm:us-east-1:123456789012:parameter/path/to/param")
+    assert astuple(parsed) == ("aws", "ssm", "us-east-1", "123456789012", "parameter/path/to/param")
+    assert Arn(**asdict(parsed)) == parsed
+
+
+@UnitTest
+def test_arn_parse_trailing_newline() -> None:
+    parsed = arnparse("arn:aws:ssm:us-east-1:123456789012:parameter/path/to/param\n")
+    assert parsed.resource == "parameter/path/to/param"
+    assert parsed.resource_id == "path/to/param"
+
+
+@UnitTest
+def test_arn_copies_keep_resource_split() -> None:
+    parsed = arnparse("arn:aws:ssm:us-east-1:123456789012:parameter/path/to/param")
+    for duplicate in copy.copy(parsed), copy.deepcopy(parsed), pickle.loads(pickle.dumps(parsed)):
+        assert duplicate == parsed
+        assert (duplicate.resource_type, duplicate.resource_id) == ("parameter", "path/to/param")
+
+    replaced = replace(parsed, resource="alarm:some-alarm")
+    assert (replaced.resource_type, replaced.resource_id) == ("alarm", "some-alarm")
@@ -1,29 +1,49 @@
 """Annotation-related utilities."""
 
 import sys
+from collections import ChainMap
 from dataclasses import InitVar
-from typing import Type, Dict, get_type_hints, Callable, Union, Any
+from functools import lru_cache
+from typing import Type, Dict, get_type_hints, Callable, Union, Any, cast
 
 
 def find_annotations(
     thing: Union[Type, Callable], globalns: Dict[str, Any] = None
 ) -> Dict[str, Type]:
     """Even though get_type_hints claims to follow inheritance, it didn't work on dataclasses."""
-    fields = {}
+    if globalns is None:
+        try:
+            # a copy is returned so that callers are free to mutate the result
+            return dict(_find_annotations_cached(thing))  # type: ignore[arg-type]
+        except TypeError:
+            pass  # unhashable things, e.g. methods bound to an unhashable instance
+
+    return _find_annotations(thing, globalns)
+
+
+@lru_cache(maxsize=512)
+def _find_annotations_cached(thing: Union[Type, Callable]) -> Dict[str, Type]:
+    """Classes and functions are long-lived; their annotations are resolved once."""
+    return _find_annotations(thing)
 
-    if isinstance(thing, type):
-        local_namespace: Dict[str, Any] = {}
 
-        for kls in reversed(
-            thing.__mro__
-        ):  # we iterate from least (object()) to most significant base.
+def _find_annotations(
+    thing: Union[Type, Callable], globalns: Dict[str, Any] = None
+) -> Dict[str, Type]:
+    """Resolve the annotations of `thing`, walking the mro of classes."""
+    if isinstance(thing, type):
+        module_names: Dict[str, None] = {}
+        for kls in thing.__mro__:  # we iterate from most to least (object()) significant base.
             # walk the hierarchy so that we get all of the potential needed imports
-            local_namespace.update(vars(sys.modules[kls.__module__]))
+            module_names.setdefault(kls.__module__)
 
-        for kls in reversed(thing.__mro__):
-            fields.update(get_type_hints(kls, globalns or {}, local_namespace))
+        # chain the module namespaces instead of copying them; the most significant base wins.
+        local_namespace = cast(
+            Dict[str, Any], ChainMap(*(vars(sys.modules[name]) for name in module_names))
+        )
 
-        return fields
+        # get_type_hints walks the mro by itself; the namespace above is what makes it work with dataclasses.
+        return get_type_hints(thing, globalns or {}, local_namespace)
 
     assert callable(thing)
 
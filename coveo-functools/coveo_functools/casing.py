@@ -1,8 +1,6 @@
 import functools
 import re
-from typing import Match, Iterable, Dict, Callable, Any, TypeVar, Mapping, Type, Final
-
-import inflection
+from typing import Match, Iterable, Dict, Callable, Any, TypeVar, Mapping, Type, Final, Tuple
 
 from .annotations import find_annotations
 
@@ -10,6 +8,13 @@ from .annotations import find_annotations
 T = TypeVar("T")
 
 
+_CAPS_CLUSTERS_RE: Final = re.compile(r"([A-Z]{2,}[a-z]?(?=$|[^a-z]))")
+_DIGITS_UNDERSCORE_RE: Final = re.compile(r"\d+_")
+# the rules of `inflection.underscore`
+_UNDERSCORE_ACRONYM_RE: Final = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_UNDERSCORE_WORD_RE: Final = re.compile(r"([a-z\d])([A-Z])")
+
+
 # noinspection PyDefaultArgument
 def snake_case(string: str, bad_casing: Iterable[str] = ()) -> str:
     """return the snake cased version of a string. bad casings may be specified: if the bad casing is found, the word
@@ -18,43 +23,59 @@ def snake_case(string: str, bad_casing: Iterable[str] = ()) -> str:
         Without bad_casing:             SomeTimeOut_s -> some_time_out_s
         With ['TimeOut'] as bad_casing: SomeTimeOut_s -> some_timeout_s
     """
+    return _snake_case(string, tuple(bad_casing))
+
+
+def _replace_caps_clusters(match: Match) -> str:
+    sub: str = match.group()
+    if len(sub) <= 3:  # DBs / DPM / ID / Id...
+        return sub.title()
+    boundary = -2 if sub[-1].isupper() else -1
+    return sub[:boundary].title() + sub[boundary:]
 
+
+def _remove_digits_underscore(match: Match) -> str:
+    sub: str = match.group()
+    assert sub[-1] == "_"
+    return sub[:-1]
+
+
+@functools.lru_cache(maxsize=4096)
+def _snake_case(string: str, bad_casing: Tuple[str, ...]) -> str:
+    """Implementation of `snake_case`. The same names come up over and over, so the results are cached."""
     # find groups of uppercase letters like: Some(URIs), (CDF)Node, (DPMs), (IDs)
     # alter the groups as such: Some(Uris), (CdfNo)ode, (Dpms), (Ids)
-    # this will remove most ambiguities for inflection.underscore() to react correctly
-    def _replace_caps_clusters(match: Match) -> str:
-        sub: str = match.group()
-        if len(sub) <= 3:  # DBs / DPM / ID / Id...
-            return sub.title()
-        boundary = -2 if sub[-1].isupper() else -1
-        return sub[:boundary].title() + sub[boundary:]
-
-    prepared = re.sub(
-        pattern=re.compile(r"([A-Z]{2,}[a-z]?(?=$|[^a-z]))"),
-        repl=_replace_caps_clusters,
-        string=string,
-    )
+    # this will remove most ambiguities for the underscore rules to react correctly
+    prepared = _CAPS_CLUSTERS_RE.sub(_replace_caps_clusters, string)
 
     # check if we can find any of the words and fix their casing
     for word in bad_casing:
         if word in prepared:
             prepared = prepared.replace(word, word.title())
 
-    result = inflection.underscore(prepared)
-    assert isinstance(result, str)  # mypy
-
-    def _remove_digits_underscore(match: Match) -> str:
-        sub: str = match.group()
-        assert sub[-1] == "_"
-        return sub[:-1]
+    # same as `inflection.underscore`, with precompiled patterns.
+    result = _UNDERSCORE_ACRONYM_RE.sub(r"\1_\2", prepared)
+    result = _UNDERSCORE_WORD_RE.sub(r"\1_\2", result)
+    result = result.replace("-", "_").lower()
 
-    # inflection will add an underscore after numbers. we don't want that.
-    result = re.sub(pattern=r"\d+_", repl=_remove_digits_underscore, string=result)
-    return result
+    # the underscore rules will add an underscore after numbers. we don't want that.
+    return _DIGITS_UNDERSCORE_RE.sub(_remove_digits_underscore, result)
 
 
 TRANSLATION_TABLE: Final = str.maketrans("", "", "_-. ")
 
+# strips like TRANSLATION_TABLE and lowercases ascii letters in the same pass.
+_ASCII_LOOKUP_KEY_TABLE: Final = str.maketrans(
+    {**{chr(c): chr(c).lower() for c in range(ord("A"), ord("Z") + 1)}, **dict.fromkeys("_-. ")}
+)
+
+
+def lookup_key(key: str) -> str:
+    """Return the normalized key under which flex looks up `key`: stripped like TRANSLATION_TABLE, and lowercased."""
+    if key.isascii():
+        return key.translate(_ASCII_LOOKUP_KEY_TABLE)
+    return key.translate(TRANSLATION_TABLE).lower()
+
 
 class _FlexcaseDecorator:
     """Allow passing kwargs to a method without consideration for casing or underscores."""
@@ -66,7 +87,19 @@ class _FlexcaseDecorator:
         self.allowed_extras = allowed_extras
 
     def __call__(self, fn: Callable[..., T]) -> Callable[..., T]:
-        _aliases: Dict[str, str] = self.create_lookup(fn, self.allowed_extras)
+        _aliases: Mapping[str, str] = self._cached_lookup(fn, tuple(self.allowed_extras or ()))
+
+        if not _aliases:
+            # nothing to remap (e.g.: untyped callables)
+            if not self.strip_extra:
+                return fn  # kwargs would go through untouched
+
+            @functools.wraps(fn)
+            def _strip_wrapper(*args: Any, **_: Any) -> Any:
+                __tracebackhide__ = True
+                return fn(*args)  # all kwargs are extras
+
+            return _strip_wrapper
 
         @functools.wraps(fn)
         def _wrapper(*args: Any, **kw: Any) -> Any:
@@ -78,14 +111,20 @@ class _FlexcaseDecorator:
     def unflex(self, lookup: Mapping[str, str], kwargs: Mapping[str, Any]) -> Dict[str, Any]:
         """Return a copy of kwargs with the correct case."""
         clean = {}
-        for key in kwargs:
-            lookup_key = self._lookup_key(key)
-            if lookup_key not in lookup:
-                if self.strip_extra:
+        strip_extra = self.strip_extra
+        for key, value in kwargs.items():
+            # inlined `lookup_key`; this loop runs for every key of every payload
+            original_key = lookup.get(
+                key.translate(_ASCII_LOOKUP_KEY_TABLE)
+                if key.isascii()
+                else key.translate(TRANSLATION_TABLE).lower()
+            )
+            if original_key is None:
+                if strip_extra:
                     continue
-                clean[key] = kwargs[key]  # don't touch this one, let it explode later
+                clean[key] = value  # don't touch this one, let it explode later
             else:
-                clean[lookup[lookup_key]] = kwargs[key]
+                clean[original_key] = value
 
         return clean
 
@@ -94,16 +133,26 @@ class _FlexcaseDecorator:
         """Create a simple lookup of stripped underscore + lowercased -> Original bases on the function's annotation.
         Additional kwargs may be allowed to go through by using `extras`
         """
-        return {
-            cls._lookup_key(annotation): annotation
-            for annotation in list(find_annotations(fn)) + list(extras or [])
-            if annotation != "return"
-        }
+        return dict(cls._cached_lookup(fn, tuple(extras or ())))
+
+    @classmethod
+    def _cached_lookup(cls, fn: Callable, extras: Tuple[str, ...] = ()) -> Mapping[str, str]:
+        """Return the lookup of `fn` from the cache. The returned mapping is shared and must not be modified."""
+        try:
+            return _create_lookup(fn, extras)
+        except TypeError:
+            # unhashable callables, e.g. methods bound to an unhashable instance
+            return _create_lookup.__wrapped__(fn, extras)
+
 
-    @staticmethod
-    def _lookup_key(key: str) -> str:
-        """Return a normalized lookup key."""
-        return key.translate(TRANSLATION_TABLE).lower()
+@functools.lru_cache(maxsize=1024)
+def _create_lookup(fn: Callable, extras: Tuple[str, ...]) -> Dict[str, str]:
+    """Implementation of `_FlexcaseDecorator.create_lookup`; find_annotations is the costly bit."""
+    return {
+        lookup_key(annotation): annotation
+        for annotation in (*find_annotations(fn), *extras)
+        if annotation != "return"
+    }
 
 
 def flexcase(
@@ -122,7 +171,7 @@ def unflex(
 ) -> Dict[str, Any]:
     """Opposite of flexcase; return a clean version of dirty_kwargs with correct case and extra kwargs stripped out."""
     flex: _FlexcaseDecorator = _FlexcaseDecorator(strip_extra=strip_extra)
-    return flex.unflex(flex.create_lookup(fn), dirty_kwargs)
+    return flex.unflex(flex._cached_lookup(fn), dirty_kwargs)
 
 
 def flexfactory(cls: Type[T], *, strip_extra: bool = True, **dirty_kwargs: Any) -> T:
@@ -26,14 +26,32 @@ class _Dispatch:
         """
         dispatcher = _singledispatch(func)
         signature = inspect.signature(func)
+        parameters = list(signature.parameters.values())
         switch_keyword = (
-            list(signature.parameters.keys())[self.switch_pos]
+            parameters[self.switch_pos].name
             if isinstance(self.switch_pos, int)
             else self.switch_pos
         )
 
+        # the index at which the switch may be given positionally, if it can be.
+        switch_index = next(
+            (
+                index
+                for index, parameter in enumerate(parameters)
+                if parameter.name == switch_keyword
+                and parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+            ),
+            None,
+        )
+
         def _wrapper(*args: Any, **kw: Any) -> T:
-            switch = signature.bind(*args, **kw).arguments[switch_keyword]
+            # fast paths; `signature.bind` is only needed to report errors.
+            if switch_index is not None and len(args) > switch_index:
+                switch = args[switch_index]
+            elif switch_keyword in kw:
+                switch = kw[switch_keyword]
+            else:
+                switch = signature.bind(*args, **kw).arguments[switch_keyword]
             dispatch_type: Type = switch if isinstance(switch, type) else switch.__class__
             return dispatcher.dispatch(dispatch_type)(*args, **kw)
 
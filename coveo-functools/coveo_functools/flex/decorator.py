@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import functools
 import inspect
+from weakref import WeakKeyDictionary
 from typing import (
     TypeVar,
     Optional,
@@ -13,7 +14,12 @@ from typing import (
     Type,
 )
 
-from coveo_functools.flex.deserializer import convert_kwargs_for_unpacking, ErrorBehavior
+from coveo_functools.flex.deserializer import (
+    ErrorBehavior,
+    ConversionPlan,
+    get_conversion_plan,
+    apply_conversion_plan,
+)
 
 T = TypeVar("T")
 
@@ -27,31 +33,45 @@ WrappedObject = Union[WrappedClass, WrappedFunction]
 
 RAW_KEY: Final[str] = "_coveo_functools_flexed_from_"
 
+# the `__init__` wrappers generated by flex, and the original `__init__` that they wrap.
+_original_inits: Final[WeakKeyDictionary[RealFunction, RealFunction]] = WeakKeyDictionary()
+
 
 @overload
-def flex(*, errors: ErrorBehavior = "deprecated") -> Callable[[RealObject], WrappedObject]: ...
+def flex(
+    *, errors: ErrorBehavior = "deprecated", keep_raw: bool = True
+) -> Callable[[RealObject], WrappedObject]: ...
 
 
 @overload
 def flex(
-    obj: None, *, errors: ErrorBehavior = "deprecated"
+    obj: None, *, errors: ErrorBehavior = "deprecated", keep_raw: bool = True
 ) -> Callable[[RealObject], WrappedObject]: ...
 
 
 @overload
-def flex(obj: RealClass, *, errors: ErrorBehavior = "deprecated") -> WrappedClass: ...
+def flex(
+    obj: RealClass, *, errors: ErrorBehavior = "deprecated", keep_raw: bool = True
+) -> WrappedClass: ...
 
 
 @overload
-def flex(obj: RealFunction, *, errors: ErrorBehavior = "deprecated") -> WrappedFunction: ...
+def flex(
+    obj: RealFunction, *, errors: ErrorBehavior = "deprecated", keep_raw: bool = True
+) -> WrappedFunction: ...
 
 
 def flex(
     obj: Optional[RealObject] = None,
     *,
     errors: ErrorBehavior = "deprecated",
+    keep_raw: bool = True,
 ) -> Union[WrappedObject, Callable[[RealObject], WrappedObject]]:
-    """Wraps `obj` into recursive flexcase magic."""
+    """
+    Wraps `obj` into recursive flexcase magic.
+
+    Unless `keep_raw` is False, the raw kwargs are kept on the created instances under `RAW_KEY`.
+    """
     if obj is not None:
         """
         Covers decorator usages without parenthesis:
@@ -71,7 +91,7 @@ def flex(
 
         """
 
-        return _generate_wrapper(obj, errors=errors)
+        return _generate_wrapper(obj, errors=errors, keep_raw=keep_raw)
 
     else:
         """
@@ -89,48 +109,73 @@ def flex(
         """
 
         # python's mechanic is going to call us again with the obj as the first (and only) argument to get a wrapper.
-        return functools.partial(flex, errors=errors)
+        return functools.partial(flex, errors=errors, keep_raw=keep_raw)
 
 
 @overload
-def _generate_wrapper(obj: RealClass, *, errors: ErrorBehavior) -> WrappedClass: ...
+def _generate_wrapper(obj: RealClass, *, errors: ErrorBehavior, keep_raw: bool) -> WrappedClass: ...
 
 
 @overload
-def _generate_wrapper(obj: RealFunction, *, errors: ErrorBehavior) -> WrappedFunction: ...
+def _generate_wrapper(
+    obj: RealFunction, *, errors: ErrorBehavior, keep_raw: bool
+) -> WrappedFunction: ...
 
 
-def _generate_wrapper(obj: RealObject, *, errors: ErrorBehavior) -> WrappedObject:
+def _generate_wrapper(obj: RealObject, *, errors: ErrorBehavior, keep_raw: bool) -> WrappedObject:
     """Generates a wrapper over obj."""
     # handle custom objects
     if inspect.isclass(obj):
-        return _generate_class_wrapper(obj, errors=errors)
+        return _generate_class_wrapper(obj, errors=errors, keep_raw=keep_raw)
 
     # handle custom callables
-    return _generate_callable_wrapper(obj, errors=errors)
+    return _generate_callable_wrapper(obj, errors=errors, keep_raw=keep_raw)
 
 
-def _generate_callable_wrapper(fn: RealFunction, errors: ErrorBehavior) -> WrappedFunction:
+def _generate_callable_wrapper(
+    fn: RealFunction, errors: ErrorBehavior, keep_raw: bool
+) -> WrappedFunction:
     """Class decorators"""
 
+    plan: Optional[ConversionPlan] = None
+
     @functools.wraps(fn)
     def wrapper(*args: Any, **kwargs: Any) -> T:  # type: ignore[type-var]
-        value: T = fn(*args, **convert_kwargs_for_unpacking(kwargs, hint=fn, errors=errors))
-        if hasattr(value, "__dict__"):
+        nonlocal plan
+        if plan is None:
+            # resolved on the first call rather than on decoration, so that forward references may be resolved.
+            plan = get_conversion_plan(fn)
+
+        value: T = fn(*args, **apply_conversion_plan(kwargs, plan, errors=errors))
+        # a non-zero dict offset means that instances of this type have a `__dict__` (i.e.: not slotted/builtin)
+        if keep_raw and type(value).__dictoffset__:
             value.__dict__[RAW_KEY] = kwargs
         return value
 
     return wrapper
 
 
-def _generate_class_wrapper(obj: RealClass, *, errors: ErrorBehavior) -> WrappedClass:
+def _generate_class_wrapper(
+    obj: RealClass, *, errors: ErrorBehavior, keep_raw: bool
+) -> WrappedClass:
     """Function decorators"""
     fn: RealFunction = obj.__init__
+    # wrap the original `__init__` when the class (or a base) is already flexed, so kwargs are converted once.
+    fn = _original_inits.get(fn, fn)
+    plan: Optional[ConversionPlan] = None
 
     @functools.wraps(fn)
     def new_init(*args: Any, **kwargs: Any) -> None:
-        setattr(args[0], RAW_KEY, kwargs)  # set the raw data on self
-        fn(*args, **convert_kwargs_for_unpacking(kwargs, hint=fn, errors=errors))
+        nonlocal plan
+        if plan is None:
+            # resolved on the first call rather than on decoration, so that forward references may be resolved.
+            plan = get_conversion_plan(fn)
+
+        # set the raw data on self; writing to `__dict__` works for frozen dataclasses and skips `__setattr__`.
+        if keep_raw and type(args[0]).__dictoffset__:
+            args[0].__dict__[RAW_KEY] = kwargs
+        fn(*args, **apply_conversion_plan(kwargs, plan, errors=errors))
 
+    _original_inits[new_init] = fn
     obj.__init__ = new_init
     return obj
@@ -1,11 +1,11 @@
 import enum
-import inspect
 import logging
 import sys
 import warnings
 from collections import abc
 from contextlib import contextmanager
 from enum import Enum
+from functools import lru_cache, partial
 from inspect import isabstract, isclass
 from typing import (
     Type,
@@ -23,11 +23,12 @@ from typing import (
     Literal,
     Generator,
     Sequence,
+    Mapping,
+    Final,
 )
 
 from coveo_functools.annotations import find_annotations
-from coveo_functools.casing import TRANSLATION_TABLE, unflex
-from coveo_functools.dispatch import dispatch
+from coveo_functools.casing import TRANSLATION_TABLE, _FlexcaseDecorator, lookup_key
 from coveo_functools.exceptions import UnsupportedAnnotation, PayloadMismatch
 from coveo_functools.flex.factory_adapter import get_factory_adapter
 from coveo_functools.flex.helpers import resolve_hint
@@ -47,37 +48,148 @@ MetaHint = Union[Callable[..., T], SerializationMetadata, Type[T]]
 ErrorBehavior = Literal["raise", "ignore", "silent", "deprecated"]
 
 
+class _HintKind(enum.Enum):
+    """How values are deserialized into a hint, once it's resolved."""
+
+    PASSTHROUGH = enum.auto()
+    LITERAL = enum.auto()
+    OPTIONAL = enum.auto()
+    THING_OR_LIST = enum.auto()
+    ENUM = enum.auto()
+    LIST = enum.auto()
+    DICT = enum.auto()
+    OTHER = enum.auto()
+
+
+class _HintPlan:
+    """How to deserialize values into a hint; see `_get_hint_plan`."""
+
+    __slots__ = "kind", "origin", "args", "contains"
+
+    def __init__(
+        self,
+        kind: _HintKind,
+        origin: TypeHint,
+        args: Sequence[TypeHint],
+        contains: Optional[TypeHint] = None,
+    ) -> None:
+        self.kind = kind
+        self.origin = origin
+        self.args = args
+        self.contains = contains
+
+
+class ConversionPlan:
+    """How to convert kwargs for a callable; see `get_conversion_plan`."""
+
+    __slots__ = "lookup", "annotations", "canonical", "passthrough"
+
+    def __init__(self, lookup: Mapping[str, str], annotations: Mapping[str, TypeHint]) -> None:
+        self.lookup = lookup  # the unflex lookup
+        self.annotations = annotations  # the annotations of the arguments
+        self.canonical = frozenset(lookup.values())  # the names that unflex maps to themselves
+        # the arguments that `deserialize` returns as-is (dicts are validated, so they don't qualify)
+        self.passthrough = frozenset(
+            arg_name
+            for arg_name, arg_hint in annotations.items()
+            if arg_hint is not dict and is_passthrough_type(arg_hint)
+        )
+
+
 def convert_kwargs_for_unpacking(
     dirty_kwargs: Dict[str, Any], *, hint: MetaHint, errors: ErrorBehavior = "deprecated"
 ) -> Dict[str, Any]:
     """Return a copy of `dirty_kwargs` that can be `**unpacked` to hint. Values will be deserialized recursively."""
+    _check_error_behavior(errors)
+    return _convert_kwargs_for_unpacking(dirty_kwargs, hint, errors)
+
+
+def _convert_kwargs_for_unpacking(
+    dirty_kwargs: Dict[str, Any], hint: MetaHint, errors: ErrorBehavior
+) -> Dict[str, Any]:
+    """`convert_kwargs_for_unpacking` without the error behavior checks, for recursive calls."""
     # start by determining what fn should be based on the hint
     additional_metadata: Dict[str, SerializationMetadata] = {}
     if isinstance(hint, SerializationMetadata):
         fn: Callable[..., T] = hint.import_type().__init__
         # the additional metadata will be applied on the arguments of `fn` and may contain more specific type info
         additional_metadata = hint.additional_metadata
-    elif inspect.isclass(hint):
+    elif isclass(hint):
         fn = hint.__init__
     else:
         fn = hint
 
-    # clean the casing of the kwargs so they match fn's argument names.
-    mapped_kwargs = unflex(fn, dirty_kwargs)
+    plan = get_conversion_plan(fn)
+    if additional_metadata:
+        plan = ConversionPlan(plan.lookup, {**plan.annotations, **additional_metadata})
+
+    return _apply_conversion_plan(dirty_kwargs, plan, errors)
+
+
+def apply_conversion_plan(
+    dirty_kwargs: Dict[str, Any], plan: ConversionPlan, *, errors: ErrorBehavior = "deprecated"
+) -> Dict[str, Any]:
+    """Like `convert_kwargs_for_unpacking`, but using a plan obtained from `get_conversion_plan`."""
+    _check_error_behavior(errors)
+    return _apply_conversion_plan(dirty_kwargs, plan, errors)
+
+
+def _apply_conversion_plan(
+    dirty_kwargs: Dict[str, Any], plan: ConversionPlan, errors: ErrorBehavior
+) -> Dict[str, Any]:
+    """`apply_conversion_plan` without the error behavior checks, for recursive calls."""
+    # the casing of the kwargs is cleaned on the fly so that they match fn's argument names.
+    # when all the keys are already clean, the lookup would map each of them to itself.
+    lookup = None if plan.canonical.issuperset(dirty_kwargs) else plan.lookup
+
+    # passthrough values can skip `deserialize`, unless an adapter may change them.
+    passthrough = plan.passthrough
 
     # convert the values so they match the additional metadata if available, else fn's annotations.
+    # the payload is iterated rather than the annotations: arguments with defaults are often omitted.
+    annotations = plan.annotations
     converted_kwargs = {}
-    for arg_name, arg_hint in {**find_annotations(fn), **additional_metadata}.items():
-        if arg_name not in mapped_kwargs:
-            continue  # this may be ok, for instance if the target argument has a default
-
-        converted_kwargs[arg_name] = deserialize(
-            mapped_kwargs[arg_name], hint=arg_hint, errors=errors
-        )
+    for key, value in dirty_kwargs.items():
+        arg_name = key if lookup is None else lookup.get(lookup_key(key))
+        if arg_name not in annotations:
+            continue  # extra kwargs are stripped
+
+        arg_hint = annotations[arg_name]
+        if (
+            arg_name in passthrough
+            and not get_subclass_adapter(arg_hint)
+            and not get_factory_adapter(arg_hint)
+        ):
+            converted_kwargs[arg_name] = value
+        else:
+            converted_kwargs[arg_name] = _deserialize_value(value, arg_hint, errors)
 
     return converted_kwargs
 
 
+def get_conversion_plan(fn: Callable) -> ConversionPlan:
+    """
+    Return what is needed to convert kwargs for `fn`: its unflex lookup and the annotations of its arguments.
+    The returned mappings are shared and must not be modified.
+    """
+    try:
+        return _get_conversion_plan_cached(fn)
+    except TypeError:
+        # unhashable callables, e.g. methods bound to an unhashable instance
+        return _get_conversion_plan_cached.__wrapped__(fn)
+
+
+@lru_cache(maxsize=1024)
+def _get_conversion_plan_cached(fn: Callable) -> ConversionPlan:
+    """The introspection of a callable is done once."""
+    annotations = {
+        arg_name: arg_hint
+        for arg_name, arg_hint in find_annotations(fn).items()
+        if arg_name != "return"
+    }
+    return ConversionPlan(_FlexcaseDecorator.create_lookup(fn), annotations)
+
+
 @overload
 def deserialize(
     value: Any,
@@ -143,6 +255,12 @@ def deserialize(
         >>> deserialize([], hint=dict, errors='ignore')
         []
     """
+    _check_error_behavior(errors)
+    return cast(T, _deserialize_value(value, hint, errors))
+
+
+def _check_error_behavior(errors: ErrorBehavior) -> None:
+    """Validate the error behavior given to a public function. Recursive calls don't check it again."""
     valid_error_modes = "raise", "ignore", "silent", "deprecated"
     if errors not in valid_error_modes:
         raise ValueError(f"'{errors=}' is not valid, {valid_error_modes=}")
@@ -154,6 +272,9 @@ def deserialize(
             category=DeprecationWarning,
         )
 
+
+def _deserialize_value(value: Any, hint: TypeHint, errors: ErrorBehavior) -> Any:
+    """`deserialize` without the error behavior checks, for recursive calls."""
     if value is None:
         return value
 
@@ -163,8 +284,174 @@ def deserialize(
 
     elif factory := get_factory_adapter(hint):
         # factories are expected to return an instance of the correct type, so we can just bypass everything else.
-        return cast(T, factory(value))
+        return factory(value)
+
+    if hint is not dict and is_passthrough_type(hint):
+        # fast path for the most common hints (e.g.: json values); no need to look for a plan.
+        # dicts are an exception: the value must still be validated, and its content deserialized.
+        return value
+
+    return _deserialize_with_plan(value, hint, _get_hint_plan(hint), errors)
+
+
+def _deserialize_with_plan(
+    value: Any, hint: TypeHint, plan: _HintPlan, errors: ErrorBehavior
+) -> Any:
+    """What `deserialize` does once the adapters are applied and the hint's plan is known."""
+    return _plan_handlers[plan.kind](value, hint, plan, errors)
+
+
+PlanHandler = Callable[[Any, TypeHint, _HintPlan, ErrorBehavior], Any]
+
+
+def _handle_passthrough(value: Any, hint: TypeHint, plan: _HintPlan, errors: ErrorBehavior) -> Any:
+    # we always return those without validation
+    return value
+
+
+def _handle_literal(value: Any, hint: TypeHint, plan: _HintPlan, errors: ErrorBehavior) -> Any:
+    # This is a special case that conflicts with other "flex" rules that we must treat first.
+    # More specifically, Unions of different types are only allowed here, which is incompatible with
+    # the 'thing-or-list-of-things' decision.
+    return _deserialize_literal(value, plan.origin, plan.args, hint, errors)
+
+
+def _handle_optional(value: Any, hint: TypeHint, plan: _HintPlan, errors: ErrorBehavior) -> Any:
+    # launch again with only that type
+    return _deserialize_value(value, plan.contains, errors)
+
+
+def _handle_thing_or_list(
+    value: Any, hint: TypeHint, plan: _HintPlan, errors: ErrorBehavior
+) -> Any:
+    # special support for variadic "thing-or-list-of-things" payloads is based on the type of the value.
+    if _is_array_like(value):
+        # the resolved args are always (Thing, List[Thing]); reuse the list hint instead of creating it again.
+        return _deserialize_value(value, plan.args[1], errors)
+    return _deserialize_value(value, plan.contains, errors)
+
+
+def _handle_enum(value: Any, hint: TypeHint, plan: _HintPlan, errors: ErrorBehavior) -> Any:
+    with _apply_error_behavior(errors, value, plan.origin, plan.args):
+        return _deserialize_enum(value, hint=hint, errors=errors, contains=plan.contains)
+    return value
+
+
+def _handle_list(value: Any, hint: TypeHint, plan: _HintPlan, errors: ErrorBehavior) -> Any:
+    with _apply_error_behavior(errors, value, plan.origin, plan.args):
+        return _deserialize(value, hint=list, errors=errors, contains=plan.contains)
+    return value
+
+
+def _handle_dict(value: Any, hint: TypeHint, plan: _HintPlan, errors: ErrorBehavior) -> Any:
+    with _apply_error_behavior(errors, value, plan.origin, plan.args):
+        return _deserialize(value, hint=dict, errors=errors, contains=plan.contains)
+    return value
+
+
+def _handle_other(value: Any, hint: TypeHint, plan: _HintPlan, errors: ErrorBehavior) -> Any:
+    origin = plan.origin
+    with _apply_error_behavior(errors, value, origin, plan.args):
+        if isinstance(origin, type) and isinstance(value, origin):
+            # it's a custom class and it's already converted
+            return value
+
+        # annotation arguments are not supported past this point, so we can omit them.
+        return _deserialize(value, hint=origin, errors=errors)
+    return value
+
+
+# the plan's kind selects the handler with a single lookup instead of a chain of comparisons.
+_plan_handlers: Final[Dict[_HintKind, PlanHandler]] = {
+    _HintKind.PASSTHROUGH: _handle_passthrough,
+    _HintKind.LITERAL: _handle_literal,
+    _HintKind.OPTIONAL: _handle_optional,
+    _HintKind.THING_OR_LIST: _handle_thing_or_list,
+    _HintKind.ENUM: _handle_enum,
+    _HintKind.LIST: _handle_list,
+    _HintKind.DICT: _handle_dict,
+    _HintKind.OTHER: _handle_other,
+}
+
 
+def _get_item_deserializer(hint: TypeHint, errors: ErrorBehavior) -> Callable[[Any], Any]:
+    """
+    Return a function that deserializes the items of a container into `hint`.
+    The checks that don't depend on the item's value are done once, instead of once per item.
+    """
+    if get_subclass_adapter(hint) or get_factory_adapter(hint):
+        # adapters work on the value; go through the whole thing for each item.
+        return partial(_deserialize_value, hint=hint, errors=errors)
+
+    if hint is not dict and is_passthrough_type(hint):
+        return _passthrough
+
+    deserialize_item: Optional[Callable[[Any], Any]] = None
+
+    def _deserialize_item(item: Any) -> Any:
+        nonlocal deserialize_item
+        if item is None:
+            return item
+
+        if deserialize_item is None:
+            # the plan is resolved on the first item; empty containers are fine whatever the hint, e.g. abstract.
+            deserialize_item = _get_planned_item_deserializer(hint, errors)
+        return deserialize_item(item)
+
+    return _deserialize_item
+
+
+def _get_planned_item_deserializer(hint: TypeHint, errors: ErrorBehavior) -> Callable[[Any], Any]:
+    """The part of `_get_item_deserializer` that needs the plan of `hint`. None items must be handled beforehand."""
+    plan = _get_hint_plan(hint)
+    if plan.kind is _HintKind.LIST:
+        return _get_list_item_deserializer(plan, errors)
+
+    # same as `_deserialize_with_plan`, minus a lookup per item
+    return partial(_plan_handlers[plan.kind], hint=hint, plan=plan, errors=errors)
+
+
+def _get_list_item_deserializer(plan: _HintPlan, errors: ErrorBehavior) -> Callable[[Any], Any]:
+    """
+    Like `_get_item_deserializer` for items that are lists themselves, e.g. the inner lists of List[List[T]].
+    The deserializer of the inner items is resolved once, instead of once per inner list.
+    """
+    deserialize_inner_item: Optional[Callable[[Any], Any]] = None
+
+    def _deserialize_list_item(item: Any) -> Any:
+        nonlocal deserialize_inner_item
+        if item is None:
+            return item
+
+        # same as going through `deserialize`, which would end up in `_deserialize_list`.
+        with _apply_error_behavior(errors, item, plan.origin, plan.args):
+            if not _is_array_like(item):
+                raise PayloadMismatch(item, list, plan.contains)
+
+            if deserialize_inner_item is None:
+                deserialize_inner_item = _get_item_deserializer(plan.contains, errors)
+            return _deserialize_items(item, deserialize_inner_item)
+        return item
+
+    return _deserialize_list_item
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _get_hint_plan(hint: TypeHint) -> _HintPlan:
+    """Return how to deserialize values into `hint`. Adapters must be applied beforehand."""
+    try:
+        return _get_hint_plan_cached(hint)
+    except TypeError:
+        # unhashable hints, e.g. SerializationMetadata instances
+        return _get_hint_plan_cached.__wrapped__(hint)
+
+
+@lru_cache(maxsize=1024)
+def _get_hint_plan_cached(hint: TypeHint) -> _HintPlan:
+    """The hints are static; they are resolved once instead of on every value."""
     if isabstract(hint):
         raise UnsupportedAnnotation(
             f"{hint} is abstract and cannot be instantiated."
@@ -174,13 +461,11 @@ def deserialize(
 
     # origin: like `list` for `List` or `Union` for `Optional`
     # args: like (str, int) for Optional[str, int]
-    origin, args = resolve_hint(hint)
+    origin, resolved_args = resolve_hint(hint)
+    args = tuple(resolved_args)  # the plan is shared
 
     if origin is Literal:
-        # This is a special case that conflicts with other "flex" rules that we must treat first.
-        # More specifically, Unions of different types are only allowed here, which is incompatible with
-        # the 'thing-or-list-of-things' decision.
-        return _deserialize_literal(value, origin, args, hint, errors)
+        return _HintPlan(_HintKind.LITERAL, origin, args)
 
     # implementation detail: in the presence of a custom type in the args, the `_resolve_hint` function
     # always puts the real type first. This is only applicable to the thing-or-list-of-things feature.
@@ -190,56 +475,36 @@ def deserialize(
         Union,  # Union[str, int]
         UnionType,  # str | int (py3.10)
     ):
-        if not {*args}.difference(PASSTHROUGH_TYPES):
+        if PASSTHROUGH_TYPES.issuperset(args):
             # Unions of PASSTHROUGH_TYPES are allowed and assumed to be in the proper type already
-            return cast(T, value)
+            return _HintPlan(_HintKind.PASSTHROUGH, origin, args)
 
         if len(args) == 1:
-            # launch again with only that type
-            return cast(T, deserialize(value, hint=args[0], errors=errors))
+            return _HintPlan(_HintKind.OPTIONAL, origin, args, target_type)
 
         if len(args) == 2:
-            # special support for variadic "thing-or-list-of-things" payloads is based on the type of the value.
-            if _is_array_like(value):
-                return cast(T, deserialize(value, hint=List[target_type], errors=errors))
-            else:
-                return cast(T, deserialize(value, hint=target_type, errors=errors))
-
-    with _apply_error_behavior(errors, value, origin, args):
-        if isinstance(origin, enum.EnumMeta):
-            # This is a special case that came up when Enum started accepting this notation:
-            #   class MyEnum(str, Enum): ...
-            # The problem is that when confronted against multiple base classes, the `dispatch` function
-            # will favor the first one, causing the string deserialization function to be launched instead of the
-            # enum one.
-            return cast(
-                T,
-                _deserialize_enum(
-                    value,
-                    hint=hint,
-                    errors=errors,
-                    contains=_resolve_enum_data_type(cast(Type[Enum], hint)),
-                ),
-            )
+            return _HintPlan(_HintKind.THING_OR_LIST, origin, args, target_type)
+
+    if isinstance(origin, enum.EnumMeta):
+        # This is a special case that came up when Enum started accepting this notation:
+        #   class MyEnum(str, Enum): ...
+        # The problem is that when confronted against multiple base classes, `_get_deserializer`
+        # will favor the first one, causing the string deserialization function to be launched instead of the
+        # enum one.
+        return _HintPlan(
+            _HintKind.ENUM, origin, args, _resolve_enum_data_type(cast(Type[Enum], hint))
+        )
 
-        if origin is list:
-            return cast(T, _deserialize(value, hint=list, errors=errors, contains=target_type))
+    if origin is list:
+        return _HintPlan(_HintKind.LIST, origin, args, target_type)
 
-        if origin is dict:
-            return cast(T, _deserialize(value, hint=dict, errors=errors, contains=args or None))
+    if origin is dict:
+        return _HintPlan(_HintKind.DICT, origin, args, args or None)
 
-        if is_passthrough_type(origin):
-            # we always return those without validation
-            return cast(T, value)
+    if is_passthrough_type(origin):
+        return _HintPlan(_HintKind.PASSTHROUGH, origin, args)
 
-        if inspect.isclass(origin) and isinstance(value, origin):
-            # it's a custom class and it's already converted
-            return cast(T, value)
-
-        # annotation arguments are not supported past this point, so we can omit them.
-        return cast(T, _deserialize(value, hint=origin, errors=errors))
-
-    return value
+    return _HintPlan(_HintKind.OTHER, origin, args)
 
 
 @contextmanager
@@ -292,7 +557,7 @@ def _deserialize_literal(
     errors: ErrorBehavior,
 ) -> T:
     """
-    This is a special case that conflicts with other "flex" rules, and must be treated outside the @dispatch.
+    This is a special case that conflicts with other "flex" rules, and must be treated outside of `_deserialize`.
     More specifically, Unions of different types are only allowed here, which is incompatible with
     the 'thing-or-list-of-things' decision.
     """
@@ -339,21 +604,51 @@ def _deserialize_literal(
     return cast(T, literal)
 
 
-@dispatch(switch_pos="hint")
+Deserializer = Callable[..., Any]
+
+# the deserializers for a type (or an instance of it) and its subclasses; see `_get_deserializer`.
+_deserializers: Dict[type, Deserializer] = {}
+
+
+def _register_deserializer(*types: type) -> Callable[[Deserializer], Deserializer]:
+    """Decorator that registers a deserializer for the given types."""
+
+    def _register(deserializer: Deserializer) -> Deserializer:
+        for type_ in types:
+            _deserializers[type_] = deserializer
+        return deserializer
+
+    return _register
+
+
 def _deserialize(
     value: Any, *, hint: TypeHint, errors: ErrorBehavior, contains: Optional[TypeHint] = None
+) -> Any:
+    """Deserialize value using the deserializer registered for hint, which may be a type or an instance."""
+    dispatch_type: type = hint if isinstance(hint, type) else type(hint)
+    return _get_deserializer(dispatch_type)(value, hint=hint, errors=errors, contains=contains)
+
+
+@lru_cache(maxsize=1024)
+def _get_deserializer(dispatch_type: type) -> Deserializer:
+    """Return the deserializer registered for the closest base of `dispatch_type`."""
+    for base in dispatch_type.__mro__:
+        if deserializer := _deserializers.get(base):
+            return deserializer
+    return _deserialize_fallback
+
+
+def _deserialize_fallback(
+    value: Any, *, hint: TypeHint, errors: ErrorBehavior, contains: Optional[TypeHint] = None
 ) -> Any:
     """Fallback deserialization; if value is dict and hint is callable, flex it. Else just return value."""
-    if callable(hint) and isinstance(value, dict):
-        return hint(**convert_kwargs_for_unpacking(value, hint=hint, errors=errors))
+    if isinstance(value, dict) and callable(hint):
+        return hint(**_convert_kwargs_for_unpacking(value, hint, errors))
 
     raise PayloadMismatch(value, hint, contains)
 
 
-@_deserialize.register(str)
-@_deserialize.register(int)
-@_deserialize.register(bytes)
-@_deserialize.register(float)
+@_register_deserializer(str, int, bytes, float)
 def _deserialize_immutable(
     value: Any,
     *,
@@ -366,39 +661,48 @@ def _deserialize_immutable(
     return hint(value)
 
 
-@_deserialize.register(list)
+@_register_deserializer(list)
 def _deserialize_list(
     value: Any, *, hint: Type[list], errors: ErrorBehavior, contains: Optional[TypeHint] = None
 ) -> List:
     """List deserialization into list of things."""
     if _is_array_like(value):
-        return [deserialize(item, hint=contains, errors=errors) for item in value]
+        return _deserialize_items(value, _get_item_deserializer(contains, errors))
 
     raise PayloadMismatch(value, hint, contains)
 
 
-@_deserialize.register(dict)
+def _deserialize_items(value: Iterable, deserialize_item: Callable[[Any], Any]) -> List:
+    """Deserialize the items of an array-like value into a list."""
+    if deserialize_item is _passthrough:
+        return list(value)  # e.g. List[int]; the items are copied over as-is.
+    return [deserialize_item(item) for item in value]
+
+
+@_register_deserializer(dict)
 def _deserialize_dict(
     value: Any, *, hint: Type[dict], errors: ErrorBehavior, contains: Optional[TypeHint] = None
 ) -> Dict:
-    if isinstance(value, abc.Mapping):
+    # json payloads are plain dicts; check for those before going through the abc machinery.
+    if type(value) is dict or isinstance(value, abc.Mapping):
         key_type, value_type = (str, Any) if contains in (None, Any) else contains
 
-        return {
-            deserialize(key, hint=key_type, errors=errors): deserialize(
-                val, hint=value_type, errors=errors
-            )
-            for key, val in value.items()
-        }
+        deserialize_key = _get_item_deserializer(key_type, errors)
+        deserialize_value = _get_item_deserializer(value_type, errors)
+        if deserialize_key is _passthrough and deserialize_value is _passthrough:
+            return dict(value)  # e.g. Dict[str, int]; the items are copied over as-is.
+        return {deserialize_key(key): deserialize_value(val) for key, val in value.items()}
 
     raise PayloadMismatch(value, hint, contains)
 
 
+@lru_cache(maxsize=4096)
 def _flex_translate(string: str) -> str:
+    """Payloads tend to repeat the same few enum spellings; they are translated once."""
     return string.casefold().translate(TRANSLATION_TABLE)
 
 
-@_deserialize.register(Enum)
+@_register_deserializer(Enum)
 def _deserialize_enum(
     value: Any, *, hint: Type[Enum], errors: ErrorBehavior, contains: Optional[TypeHint] = None
 ) -> Enum:
@@ -406,37 +710,70 @@ def _deserialize_enum(
         # This is useful for e.g. `Literal[MyEnum.This, MyEnum.That]`
         hint = hint.__class__
 
+    enum_instance = _get_enum_member(hint, value)
+    if enum_instance is not None:
+        return enum_instance
+
+    if isinstance(value, str):
+        # fish!
+        enum_instance = _get_flex_enum_lookup(hint).get(_flex_translate(value))
+        if enum_instance is not None:
+            return enum_instance
+
+    raise PayloadMismatch(value, hint, contains)
+
+
+def _get_enum_member(enum_cls: Type[Enum], value: Any) -> Optional[Enum]:
+    """Return the member of `enum_cls` matching `value` by value, else by name."""
+    if isinstance(value, enum_cls):
+        # already a member; the maps below are keyed by values and names, not members.
+        return value
+
+    if _has_default_missing(enum_cls):
+        try:
+            # the lookups done by `enum_cls(value)` and `enum_cls[value]`, without raising on misses.
+            enum_instance = enum_cls._value2member_map_.get(value)
+            if enum_instance is None:
+                enum_instance = enum_cls._member_map_.get(value)
+            return enum_instance
+        except TypeError:
+            pass  # unhashable values; let the enum look for them.
+
     try:
         # value match
-        return hint(value)
+        return enum_cls(value)
     except ValueError:
         pass
 
     try:
         # name match
-        return hint[value]
+        return enum_cls[value]
     except KeyError:
-        pass
+        return None
 
-    if isinstance(value, str):
-        # fish!
-        simplekey = _flex_translate(value)
-        for enum_name, enum_instance in cast(Iterable[Tuple[str, Enum]], hint.__members__.items()):
-            if (
-                # fish for value typos first
-                (
-                    isinstance(enum_instance.value, str)
-                    and _flex_translate(enum_instance.value) == simplekey
-                )
-                # then look if the enum names look like it would match
-                or _flex_translate(enum_name) == simplekey
-            ):
-                return enum_instance
 
-    raise PayloadMismatch(value, hint, contains)
+@lru_cache(maxsize=256)
+def _has_default_missing(enum_cls: Type[Enum]) -> bool:
+    """True if `enum_cls(value)` finds members by value only, i.e. it doesn't override `_missing_` like Flag does."""
+    return getattr(enum_cls._missing_, "__func__", None) is getattr(
+        Enum._missing_, "__func__", None
+    )
 
 
-@_deserialize.register(SerializationMetadata)
+@lru_cache(maxsize=256)
+def _get_flex_enum_lookup(enum_cls: Type[Enum]) -> Dict[str, Enum]:
+    """Return the members of an enum by their flexed values and names. Shared; must not be modified."""
+    lookup: Dict[str, Enum] = {}
+    for enum_name, enum_instance in cast(Iterable[Tuple[str, Enum]], enum_cls.__members__.items()):
+        # fish for value typos first
+        if isinstance(enum_instance.value, str):
+            lookup.setdefault(_flex_translate(enum_instance.value), enum_instance)
+        # then look if the enum names look like it would match
+        lookup.setdefault(_flex_translate(enum_name), enum_instance)
+    return lookup
+
+
+@_register_deserializer(SerializationMetadata)
 def _deserialize_with_metadata(
     value: Any,
     *,
@@ -445,47 +782,56 @@ def _deserialize_with_metadata(
     contains: Optional[TypeHint] = None,
 ) -> Any:
     if isclass(hint) and issubclass(hint, SerializationMetadata):
-        # this is an edge case; the dispatch will end up here when hint is either the SerializationMetadata type,
+        # this is an edge case; `_deserialize` will end up here when hint is either the SerializationMetadata type,
         # or an instance thereof.
         # Here, we take a shortcut to deserialize `value` into an instance of `SerializationMetadata`.
         # This happens when flex is also used to serialize the metadata headers.
-        return hint(**convert_kwargs_for_unpacking(value, hint=hint, errors=errors))  # type: ignore[misc]
+        return hint(**_convert_kwargs_for_unpacking(value, hint, errors))  # type: ignore[misc]
 
     root_type = hint.import_type()
 
     if root_type is dict:
         # each value is converted to the type provided in the meta
         return {
-            key: deserialize(value, hint=hint.additional_metadata.get(key, value), errors=errors)
+            key: _deserialize_value(value, hint.additional_metadata.get(key, value), errors)
             for key, value in value.items()
         }
 
     if root_type is list:
         # the value in this case is a Dict[str, SerializationMetadata] where they key is the index within the list.
+        # the indexes are converted once, so that they sort as ints without a key function.
+        item_hints = {
+            int(index): item_hint for index, item_hint in hint.additional_metadata.items()
+        }
         return [
-            deserialize(value[int(index)], hint=hint.additional_metadata[index], errors=errors)
-            for index in sorted(hint.additional_metadata, key=int)
+            _deserialize_value(value[index], item_hints[index], errors)
+            for index in sorted(item_hints)
         ]
 
     if isclass(root_type) and isinstance(value, dict):
         # typical case of unpacking value into an instance of the root type.
         return root_type(
-            **convert_kwargs_for_unpacking(value, hint=hint, errors=errors)
+            **_convert_kwargs_for_unpacking(value, hint, errors)
         )  # it's magic!  # type: ignore[no-any-return]
 
     if root_type is not SerializationMetadata:
         # the hint was refined this turn, we can deserialize again
-        return deserialize(value, hint=root_type, errors=errors)
+        return _deserialize_value(value, root_type, errors)
 
     raise PayloadMismatch(value, hint, contains)
 
 
 def _is_array_like(thing: Any) -> bool:
     """We don't want to mix up dictionaries and strings with tuples, sets and lists."""
-    return all(
-        (
-            isinstance(thing, abc.Iterable),
-            not isinstance(thing, (str, bytes)),
-            not isinstance(thing, abc.Mapping),
-        )
+    # exact type checks for the usual json suspects skip the abc machinery.
+    thing_type = type(thing)
+    if thing_type is list or thing_type is tuple:
+        return True
+    if thing_type is dict or thing_type is str or thing_type is bytes:
+        return False
+
+    return (
+        isinstance(thing, abc.Iterable)
+        and not isinstance(thing, (str, bytes))
+        and not isinstance(thing, abc.Mapping)
     )
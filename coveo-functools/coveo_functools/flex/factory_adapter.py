@@ -22,8 +22,6 @@ def register_factory_adapter(hint: TypeHint, factory: Callable[[Any], T]) -> Non
 
 def get_factory_adapter(hint: TypeHint) -> Optional[Callable[[Any], T]]:
     try:
-        hash(hint)
+        return _factory_adapters.get(hint)
     except TypeError:
-        return None
-
-    return _factory_adapters.get(hint)
+        return None  # unhashable hints can't have adapters
@@ -1,4 +1,5 @@
 from dataclasses import InitVar
+from functools import lru_cache
 from inspect import isclass
 from typing import (
     Optional,
@@ -9,13 +10,36 @@ from typing import (
     Sequence,
     Literal,
     Any,
+    Final,
 )
 
 from coveo_functools.exceptions import UnsupportedAnnotation
 from coveo_functools.flex.types import TypeHint, PASSTHROUGH_TYPES
 
+_NONE_TYPE: Final = type(None)
+
 
 def resolve_hint(thing: TypeHint) -> Tuple[TypeHint, Sequence[TypeHint]]:
+    """
+    Transform e.g. List[Union[str, bool]] into (list, (str, bool)) or Dict[str, Any] into (dict, (str, Any)).
+    The results are cached; see `_resolve_hint` for details.
+    """
+    try:
+        origin, args = _resolve_hint_cached(thing)
+    except TypeError:
+        # unhashable hints, e.g. SerializationMetadata instances
+        return _resolve_hint(thing)
+
+    return origin, args[:]  # the cached args may be a list; don't share it.
+
+
+@lru_cache(maxsize=1024)
+def _resolve_hint_cached(thing: TypeHint) -> Tuple[TypeHint, Sequence[TypeHint]]:
+    """Hints are static; they are resolved once."""
+    return _resolve_hint(thing)
+
+
+def _resolve_hint(thing: TypeHint) -> Tuple[TypeHint, Sequence[TypeHint]]:
     """
     Transform e.g. List[Union[str, bool]] into (list, (str, bool)) or Dict[str, Any] into (dict, (str, Any)).
     Also validates that the annotation is supported and removes "NoneType" if present.
@@ -37,7 +61,7 @@ def resolve_hint(thing: TypeHint) -> Tuple[TypeHint, Sequence[TypeHint]]:
             # or the shorthand InitVar[str | int]
             raise UnsupportedAnnotation(thing)
         # So for an InitVar[int], we just treat it as an int.
-        return resolve_hint(thing.type)
+        return _resolve_hint(thing.type)
     elif isclass(thing) and issubclass(thing, InitVar):
         # This is the non-annotated usage (InitVar without the [int])
         # which is equivalent to InitVar[Any]
@@ -56,8 +80,7 @@ def resolve_hint(thing: TypeHint) -> Tuple[TypeHint, Sequence[TypeHint]]:
 
     # Remove NoneType if it's present. If the value is given as None, we return None, no questions asked,
     # so we really don't need to keep this information.
-    while type(None) in args:
-        args.remove(type(None))
+    args = [arg for arg in args if arg is not _NONE_TYPE]
 
     # special consideration for literals.
     if origin is Literal:
@@ -66,7 +89,7 @@ def resolve_hint(thing: TypeHint) -> Tuple[TypeHint, Sequence[TypeHint]]:
         # The caller must look out for Literal as the origin and react accordingly.
         return origin, args
 
-    if not set(args).difference(PASSTHROUGH_TYPES):
+    if PASSTHROUGH_TYPES.issuperset(args):
         # If all containing types are passthrough types, everything shall be fine.
         return origin, args
 
@@ -23,8 +23,6 @@ def register_subclass_adapter(hint: TypeHint, adapter: Callable[[Any], TypeHint]
 
 def get_subclass_adapter(hint: TypeHint) -> Optional[Callable[[Any], Type[T]]]:
     try:
-        hash(hint)
+        return _subclass_adapters.get(hint)
     except TypeError:
-        return None
-
-    return _subclass_adapters.get(hint)
+        return None  # unhashable hints can't have adapters
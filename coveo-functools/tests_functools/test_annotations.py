@@ -38,3 +38,11 @@ def test_find_annotations() -> None:
 def test_find_return_annotation() -> None:
     return_response_type = find_return_annotation(MockClass.mock_method, globals())
     assert return_response_type is bytes
+
+
+@UnitTest
+def test_find_annotations_cached_copy() -> None:
+    """The annotations are cached, but callers may still mutate the result."""
+    hints = find_annotations(MockDataClass)
+    hints.clear()
+    assert find_annotations(MockDataClass) == {"a": int, "b": str, "c": bool}
@@ -1,5 +1,6 @@
 from types import FunctionType, MethodType
 from typing import Any, Union
+from unittest.mock import MagicMock
 
 import pytest
 from coveo_testing.markers import UnitTest
@@ -74,3 +75,22 @@ def test_dispatch_arg_called_with_kwarg(switch_pos: Union[int, str]) -> None:
     assert fn("", 2) == "yup"
     assert fn(arg2=2, arg1="") == "yup"
     assert fn("", arg2=2) == "yup"
+
+
+@UnitTest
+def test_dispatch_spec_mock() -> None:
+    """Objects that override `__class__`, such as spec'd mocks and proxies, dispatch on it."""
+
+    class Spec:
+        """Anything the mock could stand for."""
+
+    @dispatch()
+    def fn(_: Any) -> str:
+        return "default"
+
+    @fn.register(Spec)
+    def fn_spec(_: Spec) -> str:
+        return "spec"
+
+    assert fn(MagicMock(spec=Spec)) == "spec"
+    assert fn(_=MagicMock(spec=Spec)) == "spec"
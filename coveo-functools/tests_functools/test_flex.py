@@ -55,6 +55,52 @@ def test_flex_raw_data(obj: Any) -> None:
     assert getattr(result, RAW_KEY) == PAYLOAD
 
 
+@UnitTest
+def test_flex_frozen_dataclass() -> None:
+    @flex
+    @dataclass(frozen=True)
+    class MockFrozenDataClass:
+        inner: MockInner
+
+    instance = MockFrozenDataClass(**PAYLOAD)
+    assert instance.inner == EXPECTED_INNER
+    assert getattr(instance, RAW_KEY) == PAYLOAD
+
+
+@UnitTest
+def test_flex_class_twice() -> None:
+    @flex
+    @dataclass
+    class MockDataClass:
+        inner: MockInner
+
+    mock_class = flex(MockDataClass)
+
+    instance = mock_class(**PAYLOAD)
+    assert instance.inner == EXPECTED_INNER
+    assert getattr(instance, RAW_KEY) == PAYLOAD  # the kwargs were converted only once
+
+
+@UnitTest
+def test_flex_no_raw_data() -> None:
+    @flex(keep_raw=False)
+    @dataclass
+    class MockDataClass:
+        inner: MockInner
+
+    @flex(keep_raw=False)
+    def mock_function(inner: MockInner) -> MockInner:
+        return inner
+
+    instance = MockDataClass(**PAYLOAD)
+    assert instance.inner == EXPECTED_INNER
+    assert not hasattr(instance, RAW_KEY)
+
+    result = mock_function(**PAYLOAD)
+    assert result == EXPECTED_INNER
+    assert not hasattr(result, RAW_KEY)
+
+
 @UnitTest
 def test_flex_unions() -> None:
     @dataclass
@@ -268,3 +314,19 @@ def test_flex_recurse_into_objects() -> None:
     assert leaf.optional_str is None
     assert not hasattr(leaf, "extra")
     assert isinstance(leaf, MockLeaf)
+
+
+@flex
+def _flex_forward_reference(inner: "_ForwardReference") -> "_ForwardReference":
+    return inner
+
+
+@dataclass
+class _ForwardReference:
+    value: str
+
+
+@UnitTest
+def test_flex_forward_reference() -> None:
+    """The annotations are resolved on the first call, so they may refer to things defined after decoration."""
+    assert _flex_forward_reference(Inner={"Value": EXPECTED_VALUE}).value == EXPECTED_VALUE
@@ -115,6 +115,19 @@ def test_deserialize_any_adapter() -> None:
     assert isinstance(instance["item2"], Implementation)
 
 
+@dataclass
+class WithAny:
+    value: Any
+
+
+def test_deserialize_any_argument_adapter() -> None:
+    """Arguments annotated with passthrough types are adapted too."""
+    register_subclass_adapter(Any, lambda value: Implementation)
+
+    instance = deserialize({"value": {}}, hint=WithAny, errors="raise")
+    assert isinstance(instance.value, Implementation)
+
+
 def test_deserialize_mutate_value_adapter() -> None:
     """The adapter can mutate the payload."""
 
@@ -1,7 +1,8 @@
 import logging
 import sys
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, InitVar
-from enum import Enum
+from enum import Enum, Flag
 from typing import Final, List, Any, Optional, Union, Dict, Type, Tuple, Literal
 
 import pytest
@@ -11,7 +12,7 @@ from coveo_functools.flex.helpers import resolve_hint
 from coveo_testing.markers import UnitTest
 from coveo_testing.parametrize import parametrize
 
-from coveo_functools.exceptions import UnsupportedAnnotation
+from coveo_functools.exceptions import UnsupportedAnnotation, PayloadMismatch
 from coveo_functools.flex import deserialize, JSON_TYPES
 
 
@@ -76,12 +77,45 @@ DEFAULT_MAP_MOCK: Final[Dict[str, MockType]] = {"item1": DEFAULT_MOCK, "item2":
         ),
         (List[Optional[List[Optional[MockType]]]], [[]], [[]]),
         (List[Optional[List[Optional[MockType]]]], [], []),
+        # nested lists
+        (List[List[MockType]], [[DEFAULT_PAYLOAD], [], None], [[DEFAULT_MOCK], [], None]),
+        (List[List[List[str]]], [[[DEFAULT_VALUE]], [()]], [[[DEFAULT_VALUE]], [[]]]),
     ),
 )
 def test_deserialize_to_list(hint: Any, payload: Any, expected: Any) -> None:
     assert deserialize(payload, hint=hint, errors="raise") == expected
 
 
+@UnitTest
+def test_deserialize_nested_list_mismatch() -> None:
+    with pytest.raises(PayloadMismatch):
+        deserialize([DEFAULT_VALUE], hint=List[List[str]], errors="raise")
+
+    assert deserialize([DEFAULT_VALUE], hint=List[List[str]], errors="silent") == [DEFAULT_VALUE]
+
+
+@UnitTest
+def test_deserialize_passthrough_containers_are_copied() -> None:
+    """Containers of passthrough types are copied over as-is, but never returned as the same instance."""
+    payload_list = [DEFAULT_VALUE, None]
+    result_list = deserialize(payload_list, hint=List[Optional[str]], errors="raise")
+    assert result_list == payload_list and result_list is not payload_list
+    assert deserialize((DEFAULT_VALUE,), hint=List[str], errors="raise") == [DEFAULT_VALUE]
+
+    payload_dict = {DEFAULT_VALUE: 1}
+    result_dict = deserialize(payload_dict, hint=Dict[str, int], errors="raise")
+    assert result_dict == payload_dict and result_dict is not payload_dict
+
+
+@UnitTest
+def test_deserialize_deprecated_warns_once() -> None:
+    """The deprecation warning is emitted by the public call, not by each recursive step."""
+    with pytest.warns(DeprecationWarning) as warnings:
+        assert deserialize([DEFAULT_PAYLOAD] * 3, hint=List[MockType]) == [DEFAULT_MOCK] * 3
+
+    assert len(warnings) == 1
+
+
 @UnitTest
 def test_deserialize_unions_passthrough() -> None:
     """Anything from the json types will be given back without checking; this allows unions of base types."""
@@ -239,6 +273,32 @@ def test_deserialize_dict_invalid_union() -> None:
         _ = deserialize(DEFAULT_PAYLOAD, hint=Dict[str, Union[str, MockType]], errors="raise")
 
 
+class MockAbstract(ABC):
+    @abstractmethod
+    def method(self) -> None: ...
+
+
+@parametrize(
+    ("payload", "hint"),
+    (
+        ([], List[MockAbstract]),
+        ([None], List[MockAbstract]),
+        ([[]], List[List[MockAbstract]]),
+        ({}, Dict[str, MockAbstract]),
+        ({"key": None}, Dict[str, MockAbstract]),
+    ),
+)
+def test_deserialize_no_items_to_convert(payload: Any, hint: Any) -> None:
+    """The item hint is only checked when there are items to convert."""
+    assert deserialize(payload, hint=hint, errors="raise") == payload
+
+
+@UnitTest
+def test_deserialize_abstract_items() -> None:
+    with pytest.raises(UnsupportedAnnotation):
+        _ = deserialize([{}], hint=List[MockAbstract], errors="raise")
+
+
 @UnitTest
 @parametrize(
     ("value", "hint"),
@@ -324,6 +384,32 @@ def test_deserialize_enum_alias() -> None:
     assert SomeEnum.Job is SomeEnum.Task  # it's the same picture.
 
 
+@UnitTest
+def test_deserialize_enum_missing() -> None:
+    class SomeFlag(Flag):
+        Read = 1
+        Write = 2
+
+    class SomeMissingEnum(Enum):
+        Default = "default"
+
+        @classmethod
+        def _missing_(cls, value: object) -> "SomeMissingEnum":
+            return cls.Default
+
+    assert deserialize(3, hint=SomeFlag, errors="raise") is SomeFlag.Read | SomeFlag.Write
+    assert deserialize("write", hint=SomeFlag, errors="raise") is SomeFlag.Write
+    assert deserialize("unknown", hint=SomeMissingEnum, errors="raise") is SomeMissingEnum.Default
+
+
+@UnitTest
+def test_deserialize_enum_member() -> None:
+    assert deserialize(MockEnum.TestKey, hint=MockEnum, errors="raise") is MockEnum.TestKey
+    assert deserialize([MockEnum.OtherKey], hint=List[MockEnum], errors="raise") == [
+        MockEnum.OtherKey
+    ]
+
+
 @parametrize("immutable_type", (str, int, bytes, float))
 def test_deserialize_immutable(immutable_type: Type) -> None:
     class SubclassImmutable(immutable_type):
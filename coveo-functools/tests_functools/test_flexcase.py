@@ -101,3 +101,14 @@ def test_unflex() -> None:
         "arg2": False,
         "_Extra": None,
     }
+
+
+@UnitTest
+def test_flexcase_untyped() -> None:
+    """Without annotations, there is nothing to remap: extras are either stripped or passed through."""
+
+    def untyped(*args, **kwargs):  # type: ignore[no-untyped-def]
+        return args, kwargs
+
+    assert flexcase(untyped)(1, Arg1=2) == ((1,), {})
+    assert flexcase(untyped, strip_extra=False) is untyped